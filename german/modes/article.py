@@ -1,5 +1,8 @@
-import pandas as pd
+from __future__ import annotations
 import argparse
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    import pandas as pd
 from . import utils
 
 def article(
@@ -24,9 +27,7 @@ def article(
     # filter only nouns
     df = df[df["Category"] == "noun"]
 
-    output_list = []
-    for row in df.itertuples():
-        test = row.Word
-        expected = utils.word_from_row(row, plural = False)
-        output_list.append((test, expected))
-    return output_list
+    # test: word without article, expected: word with article
+    test = df["Word"]
+    expected = utils.word_series(df, plural = False)
+    return list(zip(test.tolist(), expected.tolist()))
@@ -1,6 +1,9 @@
-import pandas as pd
+from __future__ import annotations
 import argparse
-from . import normal, inverted
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    import pandas as pd
+from . import normal, inverted, utils
 
 def both(
     df: pd.DataFrame,
@@ -21,12 +24,16 @@ def both(
     Raises:
     None
     """
-    list_german = normal(df, args)
-    list_german = list_german[:len(list_german)//2]
+    # Sample once and split it, half for each direction
+    total = len(df) if args.length is None else min(len(df), args.length)
+    sample = utils.sample_rows(df, total)
+    # With odd totals the extra row goes to a random side
+    half = (total + int(utils.rng().integers(2))) // 2
+
+    list_german = normal(sample.iloc[:half], args)
     list_german = [(f"(German) {i[0]}", i[1]) for i in list_german]
 
-    list_translated = inverted(df, args)
-    list_translated = list_translated[:len(list_translated)//2]
+    list_translated = inverted(sample.iloc[half:], args)
     list_translated = [(f"(Translated) {i[0]}", i[1]) for i in list_translated]
 
     output_list = list_german + list_translated
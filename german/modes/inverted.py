@@ -1,5 +1,8 @@
-import pandas as pd
+from __future__ import annotations
 import argparse
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    import pandas as pd
 from . import utils
 
 def inverted(
@@ -21,12 +24,9 @@ def inverted(
     Raises:
     None
     """
-    output_list = []
-    for row in df.itertuples():
-        if args.no_show_category:
-            test = row.Translation
-        else:
-            test = f"[{row.Category}] {row.Translation}"
-        expected = utils.word_from_row(row, plural = False)
-        output_list.append((test, expected))
-    return output_list
+    # test: translation, expected: word with article
+    test = df["Translation"]
+    if not args.no_show_category:
+        test = "[" + df["Category"].astype(str) + "] " + test
+    expected = utils.word_series(df, plural = False)
+    return list(zip(test.tolist(), expected.tolist()))
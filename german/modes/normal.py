@@ -1,5 +1,8 @@
-import pandas as pd
+from __future__ import annotations
 import argparse
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    import pandas as pd
 from . import utils
 
 def normal(
@@ -21,12 +24,9 @@ def normal(
     Raises:
     None
     """
-    output_list = []
-    for row in df.itertuples():
-        if args.no_show_category:
-            test = utils.word_from_row(row, plural = False)
-        else:
-            test = f"[{row.Category}] {utils.word_from_row(row, plural = False)}"
-        expected = row.Translation
-        output_list.append((test, expected))
-    return output_list
\ No newline at end of file
+    # test: word with article, expected: translation
+    test = utils.word_series(df, plural = False)
+    if not args.no_show_category:
+        test = "[" + df["Category"].astype(str) + "] " + test
+    expected = df["Translation"]
+    return list(zip(test.tolist(), expected.tolist()))
@@ -1,5 +1,8 @@
-import pandas as pd
+from __future__ import annotations
 import argparse
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    import pandas as pd
 from . import utils
 
 def plural(
@@ -21,15 +24,11 @@ def plural(
     Raises:
     None
     """
-    # filter only nouns
-    sample = df[df["Category"] == "noun"]
+    # filter only nouns that have plural
+    sample = df[(df["Category"] == "noun") & (df["Plural"].str.len() > 0)]
 
-    output_list = []
-    for row in sample.itertuples():
-        test = utils.word_from_row(row, plural = False)
-        expected = utils.word_from_row(row, plural = True)
-        if len(expected) == 0:
-            continue
-        expected = f"{expected} ({row.Translation})"
-        output_list.append((test, expected))
-    return output_list
+    # test: singular, expected: "die plural (translation)"
+    test = utils.word_series(sample, plural = False)
+    plurals = utils.word_series(sample, plural = True)
+    expected = plurals + " (" + sample["Translation"] + ")"
+    return list(zip(test.tolist(), expected.tolist()))
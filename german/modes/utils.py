@@ -1,27 +1,77 @@
-def word_from_row(row: tuple, plural: bool = False) -> str:
+from __future__ import annotations
+import functools
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    import numpy as np
+    import pandas as pd
+
+
+@functools.cache
+def rng() -> np.random.Generator:
     """
-    Creates the word from the row with the article if exists. The plural option
-    generates the plural version "die + row.Plural". If Word or Plural columns
-    are empty in each case, it returns empty string.
+    Shared random generator for the modes that sample rows themselves. It's
+    created on the first call so importing the modes doesn't import numpy.
 
     Args:
-    - row: Pandas row from itertuples() function.
+    - None
+
+    Returns:
+    - np.random.Generator: The same generator on every call.
+
+    Raises:
+    None
+    """
+    import numpy as np
+
+    return np.random.default_rng()
+
+
+def word_series(df: pd.DataFrame, plural: bool = False) -> pd.Series:
+    """
+    Creates the words from the dataframe with the article if exists. The plural
+    option generates the plural versions "die + Plural". Rows where Word or
+    Plural columns are empty in each case give an empty string. Empty cells
+    are expected as "" (read_csv_list fills them).
+
+    Args:
+    - df: Dataframe with the words.
     - plural: Flag to select plural (true) or normal (false) versions.
 
     Returns:
-    - str: Word with the article if exists.
+    - pd.Series: Words with the article if exists, same index as df.
 
     Raises:
     None
     """
     # Get article and word
     if plural == False:
-        article = row.Article if isinstance(row.Article, str) else ""
-        word = row.Word
+        article = df["Article"]
+        word = df["Word"]
     else:
         article = "die"
-        word = row.Plural
-    # Check for empty word
-    if not isinstance(word, str) or len(word) == 0:
-        return ""
-    return f"{article} {word}".strip()
+        word = df["Plural"]
+    # Empty words give empty string
+    words = (article + " " + word).str.strip()
+    return words.where(word.str.len() > 0, "")
+
+
+def sample_rows(df: pd.DataFrame, n: int) -> pd.DataFrame:
+    """
+    Picks n random rows of the dataframe without repetition. Only the n
+    picked indices are drawn, the generator does not build a permutation of
+    the whole dataframe when n is small compared to it.
+
+    Args:
+    - df: Dataframe from where the rows will be sampled
+    - n: How many rows to pick. Must not be bigger than len(df).
+
+    Returns:
+    - pd.DataFrame: The picked rows in random order.
+
+    Raises:
+    None
+    """
+    # All rows (no --length), just shuffle them
+    if n == len(df):
+        return df.take(rng().permutation(n))
+    return df.take(rng().choice(len(df), size = n, replace = False))
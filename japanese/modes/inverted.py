@@ -1,5 +1,8 @@
-import pandas as pd
+from __future__ import annotations
 import argparse
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    import pandas as pd
 from . import utils
 
 def inverted(
@@ -21,14 +24,14 @@ def inverted(
     Raises:
     None
     """
-    output_list = []
-
-    for row in df.itertuples():
-        test = row.Translation
-        if (utils.hasKanji(row.Word)):
-            expected = f"{row.Word} ({row.Reading})"
-        else:
-            expected = row.Word
-        output_list.append((test, expected))
+    words = df["Word"].to_numpy()
+    readings = df["Reading"].to_numpy()
+    translations = df["Translation"].to_numpy()
+    kanjis = utils.hasKanjiSeries(df["Word"]).to_numpy()
+    output_list = [
+        (translation, f"{word} ({reading})" if kanji else word)
+        for word, reading, translation, kanji
+        in zip(words, readings, translations, kanjis)
+    ]
 
     return output_list
@@ -1,5 +1,8 @@
-import pandas as pd
+from __future__ import annotations
 import argparse
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    import pandas as pd
 from . import utils
 
 
@@ -22,14 +25,15 @@ def kanji(
     Raises:
     None
     """
-    output_list = []
-
-    mask = df["Word"].apply(utils.hasKanji)
+    mask = utils.hasKanjiSeries(df["Word"])
     filtered_df = df[mask]
 
-    for row in filtered_df.itertuples():
-        test = row.Word
-        expected = f"{row.Translation} ({row.Reading})"
-        output_list.append((test, expected))
+    words = filtered_df["Word"].to_numpy()
+    readings = filtered_df["Reading"].to_numpy()
+    translations = filtered_df["Translation"].to_numpy()
+    output_list = [
+        (word, f"{translation} ({reading})")
+        for word, reading, translation in zip(words, readings, translations)
+    ]
 
     return output_list
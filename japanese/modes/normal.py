@@ -1,5 +1,8 @@
-import pandas as pd
+from __future__ import annotations
 import argparse
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    import pandas as pd
 from . import utils
 
 def normal(
@@ -21,14 +24,14 @@ def normal(
     Raises:
     None
     """
-    output_list = []
-
-    for row in df.itertuples():
-        if (utils.hasKanji(row.Word)):
-            test = f"{row.Word} ({row.Reading})"
-        else:
-            test = row.Word
-        expected = row.Translation
-        output_list.append((test, expected))
+    words = df["Word"].to_numpy()
+    readings = df["Reading"].to_numpy()
+    translations = df["Translation"].to_numpy()
+    kanjis = utils.hasKanjiSeries(df["Word"]).to_numpy()
+    output_list = [
+        (f"{word} ({reading})" if kanji else word, translation)
+        for word, reading, translation, kanji
+        in zip(words, readings, translations, kanjis)
+    ]
 
     return output_list
@@ -1,4 +1,10 @@
-def hasKanji(word: str) -> bool:
-    if not isinstance(word, str):
-        return False
-    return any('\u4e00' <= ch <= '\u9fff' for ch in word)
+from __future__ import annotations
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    import pandas as pd
+
+KANJI_PATTERN = "[\u4e00-\u9fff]"
+
+def hasKanjiSeries(words: pd.Series) -> pd.Series:
+    # True for the words that contain at least one kanji, missing words False
+    return words.str.contains(KANJI_PATTERN, regex = True, na = False)
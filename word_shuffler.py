@@ -35,19 +35,29 @@
 #           More Lines
 #       """
 #   - _main() should return an integer exit code (0 = success) (default = 0).
+#   - Performance: the work is small and bound by the Python interpreter
+#       (pandas import, csv parsing, per-row string building), not by the
+#       CPU or memory. Profile before optimizing, e.g.:
+#           python -m cProfile -o out.prof word_shuffler.py ... -t
+#       and attach before/after numbers for the call sites you change.
+#       Prefer vectorized pandas over per-row loops in the modes.
 #
 # =============================================================================
 
+from __future__ import annotations
 import argparse
 from my_logger import logger, setup_logger
 
 # =============================================================================
 # MORE IMPORTS HERE
-import pandas as pd
 import random
 import sys
 import german.modes
 import japanese.modes
+# pandas is imported where it's used, so "-h" and bad args don't pay for it
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    import pandas as pd
 
 # =============================================================================
 # GLOBAL DEFINES
@@ -68,6 +78,9 @@ class ModeSelector:
         description: str,
         function: Callable[[pd.DataFrame, argparse.Namespace], list[tuple[str, str]]]
     ) -> None:
+        # Args are parsed with str.lower, store the names the same way
+        language = language.lower()
+        mode = mode.lower()
         # Create a new tag for the language
         if not language in ModeSelector.modes:
             ModeSelector.modes[language] = {}
@@ -106,27 +119,41 @@ class ModeSelector:
 
 
 #CSV_COLUMNS = ["Article", "Word", "Plural", "Translation", "Category"]
+
+# Terminal colors for the answers in test mode
+RED = "\033[91m"
+RESET = "\033[0m"
 # =============================================================================
 
 def read_csv_list(csv_list: list[str]) -> pd.DataFrame:
+    import pandas as pd
+
     # Create a list with all the words
     df_list = []
     for csv in csv_list:
         try:
             logger.info(f"Reading file {csv}")
-            df = pd.read_csv(csv)
+            df = pd.read_csv(csv, dtype = "string")
             df_list.append(df)
-        except:
+        except (OSError, UnicodeDecodeError, pd.errors.ParserError,
+                pd.errors.EmptyDataError):
             logger.error(f"Couldn't read file {csv}. Skipping")
     if not df_list:
         return pd.DataFrame()
     output_df = pd.concat(df_list, ignore_index = True)
 
+    # empty cells as "" so modes don't have to check for missing values
+    output_df = output_df.fillna("")
+
     # normalize text columns, to lower, no spaces, no duplicates
-    for col in output_df.select_dtypes(include="object").columns:
+    for col in output_df.columns:
         output_df[col] = output_df[col].str.lower().str.strip()
     output_df = output_df.drop_duplicates()
 
+    # Few distinct categories, store them as codes so filters are cheap
+    if "Category" in output_df.columns:
+        output_df["Category"] = output_df["Category"].astype("category")
+
     return output_df
 
 
@@ -153,15 +180,22 @@ def main(args: argparse.Namespace) -> int:
     logger.info(f"subset size: {total}")
 
     # Print
-    for i in range(total):
-        pair = subset[i]
-        if (args.train):
-            print(f"[{i + 1}/{total}] {pair[0]} -> {pair[1]}")
-        else:
-            input(f"[{i + 1}/{total}] {pair[0]}: ")
-            RED = "\033[91m"
-            RESET = "\033[0m"
-            print(f"\t{RED}{pair[0]} -> {pair[1]}{RESET}")
+    if (args.train):
+        # Nothing to wait for, write everything at once
+        sys.stdout.write("".join(
+            f"[{i + 1}/{total}] {pair[0]} -> {pair[1]}\n"
+            for i, pair in enumerate(subset)
+        ))
+    else:
+        prompts = [
+            f"[{i + 1}/{total}] {pair[0]}: " for i, pair in enumerate(subset)
+        ]
+        answers = [
+            f"\t{RED}{pair[0]} -> {pair[1]}{RESET}\n" for pair in subset
+        ]
+        for prompt, answer in zip(prompts, answers):
+            input(prompt)
+            sys.stdout.write(answer)
 
     return 0
 